@@ -28,12 +28,10 @@ __version__ = "3.0.0"
 # the Wayland plugin, causing noisy warnings. Force xcb (XWayland)
 # to suppress "Could not find Qt platform plugin 'wayland'" errors.
 import os as _os
-import platform as _platform
-if (_platform.system() == 'Linux'
-        and _os.environ.get('XDG_SESSION_TYPE', '').lower() == 'wayland'
-        and 'QT_QPA_PLATFORM' not in _os.environ):
+from .platform_utils import is_wayland_session as _is_wayland_session
+if _is_wayland_session() and 'QT_QPA_PLATFORM' not in _os.environ:
     _os.environ['QT_QPA_PLATFORM'] = 'xcb'
-del _os, _platform
+del _os, _is_wayland_session
 
 # Core class
 from .core import LivePlot
@@ -10,13 +10,34 @@ Design principles:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar
 
+import numpy as np
 
-@dataclass
+# Row indices into Theme.struct_colors / Theme.text_colors — the
+# structural and text palettes stacked as (N, 3) uint8 arrays
+STRUCT_BG = 0
+STRUCT_GRID_MAJOR = 1
+STRUCT_GRID_MINOR = 2
+STRUCT_GRID_CENTER = 3
+STRUCT_BORDER = 4
+STRUCT_LEGEND_BG = 5
+
+TEXT_AXIS_LABEL = 0
+TEXT_TITLE = 1
+TEXT_VALUE = 2
+TEXT_FPS = 3
+
+
+@dataclass(slots=True, frozen=True)
 class Theme:
-    """Complete color theme for the plot."""
+    """Complete color theme for the plot.
+
+    Frozen + slotted: themes are immutable palettes shared between
+    plots, so instances can be compared by identity and attribute
+    reads go through fixed slot offsets.
+    """
 
     name: str
 
@@ -40,6 +61,40 @@ class Theme:
     # Data series palette (up to 8 distinguishable colors)
     series_colors: tuple[tuple[int, int, int], ...] = ()
 
+    # series_colors flattened to an (N, 3) uint8 array, built once at
+    # construction — lets draw code index colors by integer without
+    # per-frame tuple conversions
+    palette: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # series_colors as 4-element scalars of plain ints, the cheapest
+    # form for cv2's color-argument conversion
+    series_scalars: tuple = field(init=False, repr=False, compare=False)
+
+    # Structural and text colors stacked into two contiguous (N, 3)
+    # uint8 arrays (SoA) — indexed by the STRUCT_*/TEXT_* module
+    # constants. One cache line instead of a dozen boxed tuples, and a
+    # row feeds straight into numpy region fills without conversion.
+    struct_colors: np.ndarray = field(init=False, repr=False, compare=False)
+    text_colors: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'palette',
+            np.asarray(self.series_colors, dtype=np.uint8).reshape(-1, 3))
+        object.__setattr__(
+            self, 'series_scalars',
+            tuple((int(b), int(g), int(r), 0)
+                  for b, g, r in self.series_colors))
+        object.__setattr__(
+            self, 'struct_colors',
+            np.array([self.bg, self.grid_major, self.grid_minor,
+                      self.grid_center, self.border, self.legend_bg],
+                     dtype=np.uint8))
+        object.__setattr__(
+            self, 'text_colors',
+            np.array([self.axis_label, self.title,
+                      self.value_text, self.fps_text], dtype=np.uint8))
+
 
 # ────────────────────────────────────────────────────────────
 # Built-in Themes
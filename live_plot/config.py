@@ -4,7 +4,7 @@ Configuration — Dataclasses for plot and series settings.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
@@ -16,9 +16,17 @@ class AutoScaleMode(Enum):
     AUTO_EXPAND = "expand"   # Only expand range, never shrink
 
 
-@dataclass
+@dataclass(slots=True)
 class SeriesConfig:
-    """Visual configuration for a single data series."""
+    """Visual configuration for a single data series.
+
+    slots=True: no per-instance __dict__, faster attribute access in
+    the render loop. Not frozen — color can be overridden at runtime
+    via LivePlot.update(..., color=...), which is also why this stays
+    a dataclass rather than a NamedTuple: tuple-subclass configs would
+    force a _replace() and re-plumbing of every holder on each color
+    change, for a footprint the slots layout already matches.
+    """
     label: str = ""
     color: tuple[int, int, int] = (255, 100, 255)
     line_width: int = 2
@@ -27,12 +35,28 @@ class SeriesConfig:
     show_value: bool = True
     show_glow: bool = True
 
+    # color pre-packaged as a 4-element BGR(+0) scalar of plain ints —
+    # the form cv2 converts cheapest, skipping per-channel range checks
+    # on every line/circle call. Rebuilt by refresh_color().
+    color_scalar: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.refresh_color()
+
+    def refresh_color(self) -> None:
+        """Rebuild color_scalar after mutating `color`."""
+        b, g, r = self.color
+        self.color_scalar = (int(b), int(g), int(r), 0)
 
-@dataclass
+
+@dataclass(slots=True)
 class PlotConfig:
     """
     Master configuration for the plot window.
 
+    slots=True for compact storage and fast attribute reads; kept
+    mutable because y_min/y_max are updated by set_y_limits().
+
     Layout diagram:
     ┌────────────────────────── width ──────────────────────────┐
     │                      margin_top                           │
@@ -83,28 +107,49 @@ class PlotConfig:
     show_shortcuts_hint: bool = True  # show keyboard shortcut hints
     antialiased: bool = True
     invert_y: bool = True
+    use_opengl_window: bool = False   # GPU-backed HighGUI window; needs
+                                      # OpenCV built with OpenGL support,
+                                      # falls back to a normal window
+    use_umat: bool = False            # hand frames to imshow as cv2.UMat
+                                      # (OpenCL T-API) when available
+    headless: bool = False            # no window/imshow/waitKey — render
+                                      # (and record) only; frames are
+                                      # paced by plain sleeps
 
     # ── Interaction ──
     enable_mouse_tooltip: bool = True
     enable_keyboard: bool = True
     screenshot_dir: str = "."         # directory for screenshots
 
+    # ── Scheduling ──
+    cpu_affinity: Optional[frozenset] = None
+                                      # e.g. frozenset({0, 1}): pin the
+                                      # process to those cores (Linux),
+                                      # avoiding cold-cache thread
+                                      # migrations. None = leave the OS
+                                      # scheduler alone (default)
+
     # ── Frame rate ──
     target_fps: int = 60              # 0 = unlimited
-
-    # ── Computed properties ──
-    @property
-    def plot_x(self) -> int:
-        return self.margin_left
-
-    @property
-    def plot_y(self) -> int:
-        return self.margin_top
-
-    @property
-    def plot_w(self) -> int:
-        return self.width - self.margin_left - self.margin_right
-
-    @property
-    def plot_h(self) -> int:
-        return self.height - self.margin_top - self.margin_bottom
+    async_render: bool = False        # render/display on a background
+                                      # thread; step() only appends data
+
+    # ── Computed layout ──
+    # Plain int attributes, not @property: the render loop reads these
+    # every frame and a slot read skips the descriptor call. Derived
+    # once in __post_init__; call recompute_layout() after changing
+    # width/height/margins at runtime.
+    plot_x: int = field(init=False, repr=False, compare=False)
+    plot_y: int = field(init=False, repr=False, compare=False)
+    plot_w: int = field(init=False, repr=False, compare=False)
+    plot_h: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.recompute_layout()
+
+    def recompute_layout(self) -> None:
+        """Rederive the plot-area rectangle from dimensions/margins."""
+        self.plot_x = self.margin_left
+        self.plot_y = self.margin_top
+        self.plot_w = self.width - self.margin_left - self.margin_right
+        self.plot_h = self.height - self.margin_top - self.margin_bottom
@@ -28,9 +28,14 @@ from .interactions import (
     process_key, save_screenshot,
 )
 from .platform_utils import (
-    PlatformInfo, apply_platform_fixes, cleanup_platform,
+    PlatformInfo, apply_platform_fixes, cleanup_platform, set_cpu_affinity,
 )
 
+# Quit keys, hoisted so the enable_keyboard=False fast path compares
+# plain ints instead of calling ord() per frame
+_KEY_Q = ord('q')
+_KEY_ESC = 27
+
 
 class LivePlot:
     """
@@ -65,16 +70,20 @@ class LivePlot:
 
         # Apply platform fixes once
         self._platform_info = apply_platform_fixes()
+        if self._config.cpu_affinity:
+            set_cpu_affinity(self._config.cpu_affinity)
 
         # Series storage
         self._series: dict[str, Series] = {}
         self._series_order: list[str] = []
+        self._default_series: Optional[Series] = None   # cached "_default"
 
         # Sub-systems
         self._renderer = Renderer(self._config)
         self._timer = FrameTimer(
             target_fps=self._config.target_fps,
             strategy=TimingStrategy.ADAPTIVE,
+            process_events=not self._config.headless,
         )
         self._mouse = MouseTracker()
         self._recorder = VideoRecorder(
@@ -86,15 +95,48 @@ class LivePlot:
         # State
         self._paused = False
         self._status_text = ""
-        self._status_clear_time = 0.0
+        self._status_clear_frame = 0
+        self._frame_count = 0
+        self._last_render = 0.0
+        # Event-driven frames: render only when something changed
+        self._data_dirty = True
+        self._last_mouse_pos: Optional[tuple[int, int]] = None
         self._window_created = False
         self._mouse_attached = False
         self._theme_cycle = list(THEMES.keys())
         self._theme_index = self._theme_cycle.index(self._config.theme) \
             if self._config.theme in self._theme_cycle else 0
 
-        # Thread safety
+        # Reusable row buffer for the positional step_row() path
+        self._row: Optional[np.ndarray] = None
+        # Series in add order as a plain list — update_fast() indexes
+        # it positionally, skipping the name→Series dict lookup
+        self._series_arr: list[Series] = []
+
+        # OpenCL display path: only when requested AND the runtime has it
+        self._use_umat = bool(
+            self._config.use_umat
+            and hasattr(cv2, 'ocl') and cv2.ocl.haveOpenCL()
+        )
+
+        # Thread safety. _lock pairs producers with the async render
+        # loop (multi-step buffer writes vs. snapshots); _mutator_lock
+        # only serializes the rare series add/remove, which publish
+        # rebuilt containers via _swap_series so readers never lock.
         self._lock = threading.Lock()
+        self._mutator_lock = threading.Lock()
+
+        # Async render thread (opt-in). The data thread only appends
+        # samples; all HighGUI work (render, imshow, waitKey) happens
+        # on this thread so the producer is never blocked by the GUI.
+        self._quit_flag = False
+        self._stop_event = threading.Event()
+        self._render_thread: Optional[threading.Thread] = None
+        if self._config.async_render:
+            self._render_thread = threading.Thread(
+                target=self._render_loop, name="liveplot-render", daemon=True,
+            )
+            self._render_thread.start()
 
     # ──────────────────────────────────────────────────────
     # Series Management
@@ -102,64 +144,247 @@ class LivePlot:
     def add_series(self, name: str,
                    config: Optional[SeriesConfig] = None) -> 'LivePlot':
         """Add a data series. Returns self for chaining."""
+        palette_idx = None
         if config is None:
             colors = self._renderer.theme.series_colors
-            idx = len(self._series) % len(colors)
-            config = SeriesConfig(label=name, color=colors[idx])
-        with self._lock:
-            self._series[name] = Series(config, self._config.buffer_size)
-            self._series_order.append(name)
+            palette_idx = len(self._series) % len(colors)
+            config = SeriesConfig(label=name, color=colors[palette_idx])
+        with self._mutator_lock:
+            series = Series(config, self._config.buffer_size)
+            series.palette_index = palette_idx
+            self._swap_series({**self._series, name: series},
+                              self._series_order + [name])
             self._renderer.mark_dirty()
         return self
 
     def remove_series(self, name: str) -> 'LivePlot':
         """Remove a data series."""
-        with self._lock:
+        with self._mutator_lock:
             if name in self._series:
-                del self._series[name]
-                self._series_order.remove(name)
+                if self._series[name] is self._default_series:
+                    self._default_series = None
+                new_map = dict(self._series)
+                del new_map[name]
+                new_order = [n for n in self._series_order if n != name]
+                self._swap_series(new_map, new_order)
                 self._renderer.mark_dirty()
         return self
 
+    def _swap_series(self, new_map: dict, new_order: list) -> None:
+        """Publish a rebuilt series map/order/array.
+
+        Copy-on-write: the live containers are never mutated in place.
+        Each attribute write is a single GIL-atomic store, so readers
+        (update paths, the async render loop) that snapshot the
+        attribute into a local see either the old or the new layout,
+        never a half-edited one — no lock needed on the read side.
+        """
+        self._series = new_map
+        self._series_order = new_order
+        self._series_arr = [new_map[n] for n in new_order]
+
     # ──────────────────────────────────────────────────────
     # Data Update (render only, no display)
     # ──────────────────────────────────────────────────────
-    def update(self, name_or_value, value=None, color=None) -> np.ndarray:
+    def update(self, name_or_value, value=None, color=None,
+               force_render=False) -> np.ndarray:
         """
         Push data and render. Returns canvas (numpy array).
 
         Flexible signatures:
             plot.update(42.0)                   # single value, auto-series
             plot.update("temp", 42.0)           # named series
+
+        Renders are coalesced to the display cadence: calling faster
+        than the target frame rate returns the cached canvas. Pass
+        force_render=True to rasterize this push unconditionally.
         """
+        # Single-producer fast path: without the async render thread
+        # every push and render happens on the calling thread, so the
+        # per-sample lock acquire/release pair is pure overhead — the
+        # GIL already serializes the buffer writes. The lock only
+        # guards the producer/renderer pair in async mode.
+        if self._render_thread is None:
+            self._push_one(name_or_value, value, color)
+            return self._do_render(force=force_render)
+        # Async mode: the render thread owns the renderer. Producers
+        # only append under the lock and hand back the last finished
+        # frame — rendering here would race the loop's unlocked draw
+        # over shared canvas/dirty-rect state.
         with self._lock:
-            if value is None:
-                actual_value = name_or_value
-                series_name = self._ensure_default_series(color)
-                if color is not None:
-                    self._series[series_name].config.color = color
-            else:
-                actual_value = value
-                series_name = name_or_value
+            self._push_one(name_or_value, value, color)
+        return self._renderer.canvas
+
+    def update_named(self, name: str, value: float,
+                     force_render=False) -> np.ndarray:
+        """Push one value to a named series and render.
+
+        The zero-dispatch variant of update(): no signature overload
+        resolution, just a dict lookup and a push. Prefer this in hot
+        loops that always address series by name.
+        """
+        if self._render_thread is None:
+            if not self._paused:
+                series = self._series.get(name)
+                if series is None:
+                    raise KeyError(
+                        f"Series '{name}' not found. Use add_series() first.")
+                series.push(value)
+                self._data_dirty = True
+            return self._do_render(force=force_render)
+        # Async mode: append only, the render thread draws (see update)
+        with self._lock:
+            if not self._paused:
+                series = self._series.get(name)
+                if series is None:
+                    raise KeyError(
+                        f"Series '{name}' not found. Use add_series() first.")
+                series.push(value)
+                self._data_dirty = True
+        return self._renderer.canvas
+
+    def update_default(self, value: float, color=None,
+                       force_render=False) -> np.ndarray:
+        """Push one value to the auto-created default series and render."""
+        return self.update(value, None, color, force_render)
 
-            if series_name not in self._series:
-                raise KeyError(f"Series '{series_name}' not found. Use add_series() first.")
+    def _push_one(self, name_or_value, value=None, color=None) -> None:
+        """Resolve the flexible update() signature and push one value.
 
+        Call under self._lock when the async render thread is running;
+        single-threaded callers rely on the GIL.
+        """
+        if value is None:
+            # Single-value fast path: the cached default Series skips
+            # the name→Series dict lookup on every call
+            series = self._default_series
+            if series is None:
+                self._ensure_default_series(color)
+                series = self._default_series
+            if color is not None:
+                series.set_color(color)
             if not self._paused:
-                self._series[series_name].push(actual_value)
+                series.push(name_or_value)
+                self._data_dirty = True
+            return
+
+        if name_or_value not in self._series:
+            raise KeyError(f"Series '{name_or_value}' not found. Use add_series() first.")
+
+        if not self._paused:
+            self._series[name_or_value].push(value)
+            self._data_dirty = True
+
+    def extend(self, name_or_values, values=None) -> np.ndarray:
+        """
+        Push a batch of values (array-like) and render once.
+
+        Flexible signatures (mirrors update()):
+            plot.extend(chunk)                  # auto-series
+            plot.extend("temp", chunk)          # named series
 
+        One vectorized append replaces a Python-level push() per
+        sample — use this when data arrives in blocks.
+        """
+        if values is None:
+            actual_values = name_or_values
+            series_name = self._ensure_default_series()
+        else:
+            actual_values = values
+            series_name = name_or_values
+
+        if series_name not in self._series:
+            raise KeyError(f"Series '{series_name}' not found. Use add_series() first.")
+
+        if self._render_thread is None:
+            if not self._paused:
+                self._series[series_name].extend(actual_values)
+                self._data_dirty = True
             return self._do_render()
+        # Async mode: append only, the render thread draws (see update)
+        with self._lock:
+            if not self._paused:
+                self._series[series_name].extend(actual_values)
+                self._data_dirty = True
+        return self._renderer.canvas
+
+    # Alias: the bulk-ingestion name used by ring-buffer libraries
+    update_batch = extend
 
     def update_all(self, data: dict) -> np.ndarray:
         """Push data for multiple series and render once."""
+        if self._render_thread is None:
+            self._push_dict(data)
+            return self._do_render()
+        # Async mode: append only, the render thread draws (see update)
         with self._lock:
-            if not self._paused:
-                for name, value in data.items():
-                    if name not in self._series:
-                        raise KeyError(f"Series '{name}' not found.")
-                    self._series[name].push(value)
+            self._push_dict(data)
+        return self._renderer.canvas
+
+    def _push_dict(self, data: dict) -> None:
+        """Push one value per named series (update_all body)."""
+        if self._paused:
+            return
+        for name, value in data.items():
+            if name not in self._series:
+                raise KeyError(f"Series '{name}' not found.")
+            self._series[name].push(value)
+        self._data_dirty = True
+
+    def finalize_layout(self) -> np.ndarray:
+        """
+        Freeze the current series order and return a reusable row buffer.
+
+        Call after all add_series() calls. The returned float64 array has
+        one slot per series (in add order); fill it in place and pass it
+        to step_row()/update_row() to avoid building a dict per frame.
+        """
+        with self._lock:
+            self._row = np.empty(len(self._series_order), dtype=np.float64)
+        return self._row
+
+    def update_row(self, values) -> np.ndarray:
+        """
+        Positional update_all: values[i] feeds the i-th added series.
 
+        Skips per-frame dict allocation and key hashing — pair with
+        finalize_layout() for a reusable buffer.
+        """
+        if self._render_thread is None:
+            self._push_row(values)
             return self._do_render()
+        # Async mode: append only, the render thread draws (see update)
+        with self._lock:
+            self._push_row(values)
+        return self._renderer.canvas
+
+    def update_fast(self, series_idx: int, value: float) -> None:
+        """Hot-loop ingestion: push one value by series position.
+
+        The leanest entry point for >10k samples/s producers: no name
+        lookup (series are indexed in add order), no render — display
+        happens at frame cadence via step()/the async thread. Pair the
+        index with the order series were added (or _series_order).
+
+        Lock-free by design: a concurrent async-mode frame may miss
+        the very newest sample, which the next frame picks up.
+        """
+        if self._paused:
+            return
+        self._series_arr[series_idx].push(value)
+        self._data_dirty = True
+
+    def _push_row(self, values) -> None:
+        """Push positional values in series order (update_row body)."""
+        if self._paused:
+            return
+        if len(values) != len(self._series_order):
+            raise ValueError(
+                f"Expected {len(self._series_order)} values, got {len(values)}."
+            )
+        for name, value in zip(self._series_order, values):
+            self._series[name].push(value)
+        self._data_dirty = True
 
     # ──────────────────────────────────────────────────────
     # Step = update + display + handle input (all-in-one)
@@ -175,21 +400,90 @@ class LivePlot:
                 if plot.step("sensor", read_value()):
                     break
         """
-        img = self.update(name_or_value, value, color)
+        if self._render_thread is not None:
+            with self._lock:
+                self._push_one(name_or_value, value, color)
+            return self._quit_flag
+        if value is not None and color is None:
+            # Two-arg form is always (name, value) — skip the overload
+            # resolution in update()
+            img = self.update_named(name_or_value, value)
+        else:
+            img = self.update(name_or_value, value, color)
         return self._display_and_handle(img)
 
     def step_all(self, data: dict) -> bool:
         """All-in-one for multiple series. Returns True on quit."""
+        if self._render_thread is not None:
+            with self._lock:
+                self._push_dict(data)
+            return self._quit_flag
         img = self.update_all(data)
         return self._display_and_handle(img)
 
+    def step_row(self, values) -> bool:
+        """All-in-one positional step_all. Returns True on quit."""
+        if self._render_thread is not None:
+            with self._lock:
+                self._push_row(values)
+            return self._quit_flag
+        img = self.update_row(values)
+        return self._display_and_handle(img)
+
+    def _render_loop(self) -> None:
+        """Loop run by the async render thread.
+
+        Renders, displays and handles input at target_fps while the
+        data thread keeps appending. Sets _quit_flag when the user
+        quits so pending step() calls report it.
+        """
+        while not self._stop_event.is_set():
+            # Snapshot the buffers under the lock (a few small memcpys),
+            # then rasterize outside it — producers keep pushing while
+            # OpenCV draws the previous state, overlapping data
+            # production with the expensive drawing work.
+            # One atomic read of the COW series map keeps the snapshot
+            # self-consistent even if add_series swaps it mid-frame
+            # (insertion order matches _series_order by construction).
+            series_map = self._series
+            with self._lock:
+                frame_data = {
+                    name: series.get_data().copy()
+                    for name, series in series_map.items()
+                }
+            img = self._do_render(frame_data)
+            if self._display_and_handle(img):
+                self._quit_flag = True
+                return
+
     # ──────────────────────────────────────────────────────
     # Display + Input handling
     # ──────────────────────────────────────────────────────
     def _display_and_handle(self, img: np.ndarray) -> bool:
         """Show image, handle frame timing and keyboard. Returns True on quit."""
+        if self._config.headless:
+            # Recording-only/benchmark mode: no window, no imshow, no
+            # event pump — just feed the recorder and sleep-pace. The
+            # HighGUI round-trip (~1-2ms/frame) is the throughput
+            # ceiling it removes.
+            if self._recorder.is_recording:
+                self._recorder.write_frame(img)
+            self._timer.tick()
+            return False
         self._ensure_window()
-        cv2.imshow(self._window_name, img)
+        if self._use_umat:
+            # UMat upload lets HighGUI keep the frame GPU-side (OpenCL
+            # T-API / GL interop) instead of a CPU blit per frame.
+            # Deliberately display-only: rasterizing into a UMat canvas
+            # would push the polylines/text onto the GPU, but the
+            # renderer's hot paths — mirrored-ring slices, in-place
+            # batch projection, dirty-rect restores, sprite stamps via
+            # fancy indexing — are numpy operations with no T-API
+            # equivalent, and per-call upload/download would dwarf the
+            # blit saved here.
+            cv2.imshow(self._window_name, cv2.UMat(img))
+        else:
+            cv2.imshow(self._window_name, img)
 
         # Record if active
         if self._recorder.is_recording:
@@ -205,7 +499,7 @@ class LivePlot:
     def _handle_key(self, key: int) -> bool:
         """Process keyboard input. Returns True on quit."""
         if not self._config.enable_keyboard:
-            return key == ord('q') or key == 27
+            return key == _KEY_Q or key == _KEY_ESC
 
         action = process_key(key)
 
@@ -215,6 +509,7 @@ class LivePlot:
 
         if action.toggle_pause:
             self._paused = not self._paused
+            self._data_dirty = True  # redraw the PAUSED indicator
 
         if action.screenshot:
             path = save_screenshot(
@@ -241,7 +536,7 @@ class LivePlot:
         if action.cycle_theme:
             self._theme_index = (self._theme_index + 1) % len(self._theme_cycle)
             theme_name = self._theme_cycle[self._theme_index]
-            self._renderer.theme = get_theme(theme_name)
+            self._apply_theme(get_theme(theme_name))
             self._set_status(f"Theme: {theme_name}", duration=1.5)
 
         if action.fps_delta != 0:
@@ -252,8 +547,16 @@ class LivePlot:
         return False
 
     def _set_status(self, text: str, duration: float = 2.0) -> None:
+        """Show transient status text for ~duration seconds.
+
+        Expiry is counted in rendered frames, not wall-clock time, so
+        the render path compares two ints instead of reading the clock
+        every frame while the message is visible. Unlimited mode has
+        no target rate, so the measured FPS stands in.
+        """
         self._status_text = text
-        self._status_clear_time = time.perf_counter() + duration
+        rate = self._timer.target_fps or max(self._timer.fps, 30.0)
+        self._status_clear_frame = self._frame_count + int(duration * rate)
 
     # ──────────────────────────────────────────────────────
     # Utility methods
@@ -267,6 +570,7 @@ class LivePlot:
             else:
                 for s in self._series.values():
                     s.clear()
+            self._data_dirty = True
 
     def set_y_limits(self, y_min: float, y_max: float) -> None:
         """Update Y-axis limits at runtime."""
@@ -274,8 +578,24 @@ class LivePlot:
             self._renderer.set_y_limits(y_min, y_max)
 
     def set_theme(self, theme_name: str) -> None:
-        """Switch theme by name."""
-        self._renderer.theme = get_theme(theme_name)
+        """Switch theme by name. No-op if the theme is already active."""
+        self._apply_theme(get_theme(theme_name))
+        self._theme_index = self._theme_cycle.index(theme_name) \
+            if theme_name in self._theme_cycle else self._theme_index
+
+    def _apply_theme(self, theme: Theme) -> None:
+        """Swap the renderer theme and re-tint auto-colored series.
+
+        Series whose color came from the old theme's palette would
+        otherwise keep stale colors (possibly invisible on the new
+        background); user-chosen colors are left alone.
+        """
+        self._renderer.theme = theme
+        colors = theme.series_colors
+        for s in self._series.values():
+            if s.palette_index is not None:
+                s.set_color(colors[s.palette_index % len(colors)])
+        self._data_dirty = True
 
     @property
     def fps(self) -> float:
@@ -288,6 +608,7 @@ class LivePlot:
     @paused.setter
     def paused(self, val: bool) -> None:
         self._paused = val
+        self._data_dirty = True
 
     @property
     def canvas(self) -> np.ndarray:
@@ -296,6 +617,11 @@ class LivePlot:
 
     def close(self) -> None:
         """Cleanup all resources."""
+        self._stop_event.set()
+        if (self._render_thread is not None
+                and self._render_thread.is_alive()
+                and threading.current_thread() is not self._render_thread):
+            self._render_thread.join(timeout=1.0)
         if self._recorder.is_recording:
             self._recorder.stop()
         self._timer.stop()
@@ -325,20 +651,34 @@ class LivePlot:
     def _ensure_default_series(self, color=None) -> str:
         name = "_default"
         if name not in self._series:
-            colors = self._renderer.theme.series_colors
-            idx = len(self._series) % len(colors)
-            cfg = SeriesConfig(
-                label="Value",
-                color=color if color is not None else colors[idx]
-            )
-            self._series[name] = Series(cfg, self._config.buffer_size)
-            self._series_order.append(name)
-            self._renderer.mark_dirty()
+            with self._mutator_lock:
+                colors = self._renderer.theme.series_colors
+                idx = len(self._series) % len(colors)
+                cfg = SeriesConfig(
+                    label="Value",
+                    color=color if color is not None else colors[idx]
+                )
+                series = Series(cfg, self._config.buffer_size)
+                if color is None:
+                    series.palette_index = idx
+                self._swap_series({**self._series, name: series},
+                                  self._series_order + [name])
+                self._renderer.mark_dirty()
+        self._default_series = self._series[name]
         return name
 
     def _ensure_window(self) -> None:
         if not self._window_created:
-            cv2.namedWindow(self._window_name, cv2.WINDOW_AUTOSIZE)
+            flags = cv2.WINDOW_AUTOSIZE
+            if self._config.use_opengl_window:
+                # OpenGL-backed window: imshow becomes a GPU texture
+                # upload instead of a CPU blit to the window surface.
+                flags |= getattr(cv2, 'WINDOW_OPENGL', 0)
+            try:
+                cv2.namedWindow(self._window_name, flags)
+            except cv2.error:
+                # OpenCV built without OpenGL support — plain window
+                cv2.namedWindow(self._window_name, cv2.WINDOW_AUTOSIZE)
             # Qt backend (especially on Wayland/Linux) needs at least one
             # event loop iteration before the window handle becomes valid.
             # Without this, setMouseCallback crashes with "NULL window handler".
@@ -349,11 +689,54 @@ class LivePlot:
         if not self._mouse_attached and self._config.enable_mouse_tooltip:
             self._mouse_attached = self._mouse.attach(self._window_name)
 
-    def _do_render(self) -> np.ndarray:
-        """Internal render call. Must be called under lock."""
-        # Clear expired status text
-        if self._status_text and time.perf_counter() > self._status_clear_time:
+    def _do_render(self, frame_data=None, force=False) -> np.ndarray:
+        """Internal render call.
+
+        Call under the lock, or pass a `frame_data` snapshot (as the
+        async render loop does) to draw without holding it.
+        """
+        # Rate limiting: reuse the last frame when called faster than
+        # the redraw cadence. Data pushed by callers is always kept;
+        # only the rasterization is throttled. The cadence is
+        # min_update_interval when set, otherwise half the target
+        # frame interval — so a producer pushing at 10 kHz rasterizes
+        # ~2x the display rate instead of 10k frames/s, while paced
+        # step() loops (which land on the interval ± jitter) never
+        # skip a frame they are due.
+        if not force:
+            interval = self._config.min_update_interval
+            if interval <= 0:
+                target_fps = self._timer.target_fps
+                if target_fps > 0:
+                    interval = 0.5 / target_fps
+            if interval > 0:
+                now = time.perf_counter()
+                if now - self._last_render < interval:
+                    return self._renderer.canvas
+                self._last_render = now
+
+        # Clear expired status text (integer frame compare — the
+        # clock is never read for this, and a visible status keeps
+        # the event-driven skip below from idling the renderer).
+        # Expiry dirties the frame: on an otherwise idle plot the
+        # skip gate would drop the one render that erases the text.
+        self._frame_count += 1
+        if self._status_text and self._frame_count >= self._status_clear_frame:
             self._status_text = ""
+            self._data_dirty = True
+
+        # Event-driven frames: when nothing changed since the last
+        # render — no new samples, no pending background rebuild or
+        # auto-scale animation, no status text, mouse still — reuse
+        # the frame as-is. An idle plot then costs no drawing at all.
+        mouse_pos = self._mouse.position
+        if (not self._data_dirty
+                and not self._status_text
+                and mouse_pos == self._last_mouse_pos
+                and not self._renderer.needs_redraw):
+            return self._renderer.canvas
+        self._data_dirty = False
+        self._last_mouse_pos = mouse_pos
 
         return self._renderer.render(
             series_map=self._series,
@@ -362,4 +745,5 @@ class LivePlot:
             paused=self._paused,
             mouse_pos=self._mouse.position,
             status_text=self._status_text,
+            frame_data=frame_data,
         )
@@ -30,21 +30,41 @@ Three strategies:
 
 from __future__ import annotations
 
+import math
 import time
-from collections import deque
 from enum import Enum, auto
 from typing import Optional
 
 import cv2
+import numpy as np
 
-from .platform_utils import PlatformInfo, normalize_key
+from .platform_utils import (
+    PlatformInfo, HighResWaitableTimer, monotonic_raw_ns, nanosleep_until,
+    boost_timer_resolution, release_timer_resolution,
+)
+
+# Hot-path callables bound to module globals: one dict probe per use
+# instead of module-attribute lookups (two probes each) on every tick.
+_waitKey = cv2.waitKey
+_perf_ns = time.perf_counter_ns
+
+# Build-time toggle: time every tick with CLOCK_MONOTONIC_RAW instead
+# of perf_counter. The raw clock is immune to NTP slewing (matters when
+# the FPS readout feeds measurement/recording, not just pacing) but on
+# Linux costs a ~1µs ctypes round-trip per read, so it is opt-in.
+USE_RAW_MONOTONIC_CLOCK = False
+if USE_RAW_MONOTONIC_CLOCK:
+    _perf_ns = monotonic_raw_ns
 
 
 class TimingStrategy(Enum):
     """Frame timing strategy."""
     ADAPTIVE = auto()    # Compute waitKey delay dynamically
     HYBRID = auto()      # Sleep + busy-wait for precision
-    UNLIMITED = auto()   # No throttling
+    UNLIMITED = auto()   # No throttling. Combined with
+                         # FrameTimer(process_events=False) this skips
+                         # cv2.waitKey entirely for pure throughput
+                         # benchmarking — no GUI possible in that mode.
 
 
 class FrameTimer:
@@ -76,20 +96,62 @@ class FrameTimer:
         self,
         target_fps: int = 60,
         strategy: TimingStrategy = TimingStrategy.ADAPTIVE,
+        process_events: bool = True,
     ):
         self._target_fps = max(0, target_fps)
         self._strategy = strategy
-        self._frame_duration = 1.0 / target_fps if target_fps > 0 else 0.0
-
-        # Timing state
-        self._last_tick = time.perf_counter()
-        self._frame_times: deque[float] = deque(maxlen=120)
+        # process_events=False routes every strategy to the headless
+        # tick: no cv2.waitKey at all. Without a window, waitKey(1)
+        # still pumps the Qt event loop (context switches, ~1ms floor;
+        # ~15ms on unboosted Windows) — pure overhead for recording or
+        # benchmarking. No key input or GUI updates in that mode.
+        self._process_events = process_events
+        # Integer nanoseconds: the pacing hot path is pure int
+        # subtract/compare with no FP rounding, and the adaptive EMA
+        # stays exact for arbitrarily long runs.
+        self._frame_duration_ns = (1_000_000_000 // target_fps
+                                   if target_fps > 0 else 0)
+
+        # Timing state. Frame timestamps live in a preallocated ring —
+        # no per-frame heap allocation, unlike a list/deque of boxed
+        # floats growing for hours. Values are perf_counter_ns ticks
+        # (exact in float64 for ~104 days of uptime).
+        self._last_tick_ns = _perf_ns()
+        self._ft_buf = np.empty(128, dtype=np.float64)
+        self._ft_head = 0   # next write slot
+        self._ft_n = 0      # samples currently in the window
         self._fps = 0.0
 
-        # Adaptive delay compensation
-        # Tracks how much waitKey overshoots to auto-correct
-        self._overshoot_avg = 0.0
-        self._overshoot_alpha = 0.1  # EMA smoothing factor
+        # Adaptive delay compensation. Mean overshoot is tracked with a
+        # slow EMA (new-sample weight 1/32 ≈ 22-frame half-life) and
+        # its variance alongside, so the wait subtracts mean + sigma:
+        # a fast alpha under-reports the true mean and compensating
+        # with the mean alone still leaves ~half the frames late.
+        self._overshoot_avg_ns = 0
+        self._overshoot_var_ns2 = 0
+        self._overshoot_sigma_ns = 0
+
+        # Sub-ms kernel timer for the HYBRID bulk sleep (Windows 10
+        # 1803+; .available is False elsewhere → waitKey fallback)
+        self._hr_timer = HighResWaitableTimer()
+
+        # Hold the 1ms Windows timer resolution only while this timer
+        # is alive — the raised interrupt rate costs battery, so it is
+        # scoped to the frame loop instead of the process lifetime.
+        # Refcounted in platform_utils, so nesting with
+        # apply_platform_fixes() is safe (and a no-op off Windows).
+        boost_timer_resolution()
+        self._timer_boost_held = True
+
+        # Whether any tick ever pumped the GUI event loop — stop()
+        # skips the (blocking) destroyAllWindows teardown otherwise,
+        # e.g. headless benchmarking or externally managed windows.
+        self._gui_touched = False
+
+        # Strategy resolved to a bound method once — tick() is pure
+        # delegation, with no per-frame branching on settings that
+        # only change via the target_fps/strategy setters.
+        self._tick_impl = self._select_tick_impl()
 
     def tick(self) -> int:
         """
@@ -98,103 +160,211 @@ class FrameTimer:
         Returns:
             Normalized key code (8-bit), or -1 if no key pressed.
         """
-        now = time.perf_counter()
-
-        if self._target_fps <= 0 or self._strategy == TimingStrategy.UNLIMITED:
-            # No throttling — just process GUI events
-            raw_key = cv2.waitKey(1)
-            self._record_frame(now)
-            return normalize_key(raw_key)
+        return self._tick_impl(_perf_ns())
 
-        # Time spent rendering this frame
-        elapsed = now - self._last_tick
-        remaining = self._frame_duration - elapsed
+    def _select_tick_impl(self):
+        """Build the per-frame callable for the active settings.
 
-        if self._strategy == TimingStrategy.ADAPTIVE:
-            key = self._tick_adaptive(remaining)
-        else:  # HYBRID
-            key = self._tick_hybrid(remaining)
-
-        self._record_frame(time.perf_counter())
-        return key
-
-    def _tick_adaptive(self, remaining: float) -> int:
+        Partial evaluation, without exec-based codegen: the constants a
+        strategy depends on (frame duration, record helper) are burned
+        into closure cells when the strategy or target_fps changes, so
+        the hottest path reads them as LOAD_DEREF instead of repeated
+        self-attribute loads. The setters regenerate the closure.
+        """
+        if not self._process_events:
+            return self._tick_headless
+        if self._target_fps <= 0 or self._strategy is TimingStrategy.UNLIMITED:
+            return self._tick_unlimited
+        if self._strategy is TimingStrategy.ADAPTIVE:
+            return self._make_adaptive_tick()
+        return self._make_hybrid_tick()
+
+    def _tick_headless(self, now_ns: int) -> int:
+        """Pace without a GUI: plain sleeps, no waitKey, no key input.
+
+        Used for recording-only / benchmarking sessions — skipping the
+        HighGUI event pump saves the ≥1ms (boosted Windows) per-frame
+        waitKey floor entirely. target_fps=0 means free-running.
+        """
+        remaining_ns = self._frame_duration_ns - (now_ns - self._last_tick_ns)
+        if remaining_ns > 0:
+            if nanosleep_until is not None:
+                # Absolute deadline on the perf_counter timeline —
+                # drift-free, no read→sleep gap accumulation
+                nanosleep_until(self._last_tick_ns + self._frame_duration_ns)
+            elif not self._hr_timer.sleep(remaining_ns / 1e9):
+                time.sleep(remaining_ns / 1e9)
+        self._record_frame(_perf_ns())
+        return -1
+
+    def _tick_unlimited(self, now_ns: int) -> int:
+        """No throttling — just process GUI events."""
+        self._gui_touched = True
+        raw_key = _waitKey(1)
+        self._record_frame(now_ns)
+        return raw_key & 0xFF if raw_key >= 0 else -1
+
+    def _make_adaptive_tick(self):
         """
-        Compute optimal waitKey delay accounting for OS overhead.
+        Build the ADAPTIVE implementation: compute an optimal waitKey
+        delay accounting for OS overhead.
 
         The key insight: cv2.waitKey(n) on Windows overshoots by a
         predictable amount (~0-2ms with timer boost). We track this
         overshoot with an exponential moving average and subtract it
         from the requested delay.
 
-        wait_ms = max(1, int((remaining - overshoot_avg) × 1000))
+        wait_ms = max(1, (remaining_ns - mean_ns - sigma_ns) // 1e6)
         """
-        if remaining <= 0:
-            raw_key = cv2.waitKey(1)
-            self._last_tick = time.perf_counter()
-            return normalize_key(raw_key)
-
-        # Subtract measured overshoot to compensate OS jitter
-        adjusted_ms = max(1, int((remaining - self._overshoot_avg) * 1000))
-
-        t_before = time.perf_counter()
-        raw_key = cv2.waitKey(adjusted_ms)
-        t_after = time.perf_counter()
-
-        # Update overshoot estimate (EMA)
-        actual_wait = t_after - t_before
-        requested_wait = adjusted_ms / 1000.0
-        overshoot = actual_wait - requested_wait
-        self._overshoot_avg = (
-            self._overshoot_alpha * overshoot
-            + (1 - self._overshoot_alpha) * self._overshoot_avg
-        )
-
-        self._last_tick = t_after
-        return normalize_key(raw_key)
-
-    def _tick_hybrid(self, remaining: float) -> int:
+        frame_ns = self._frame_duration_ns
+        record = self._record_frame
+
+        def tick_adaptive(now_ns: int) -> int:
+            self._gui_touched = True  # every path below pumps waitKey
+            remaining_ns = frame_ns - (now_ns - self._last_tick_ns)
+            if remaining_ns <= 0:
+                raw_key = _waitKey(1)
+                record(_perf_ns())
+                return raw_key & 0xFF if raw_key >= 0 else -1
+
+            # Subtract measured overshoot mean AND one standard
+            # deviation: aiming at the mean alone leaves roughly half
+            # the frames late
+            adjusted_ms = (remaining_ns - self._overshoot_avg_ns
+                           - self._overshoot_sigma_ns) // 1_000_000
+            if adjusted_ms < 1:
+                adjusted_ms = 1
+
+            t_before = _perf_ns()
+            raw_key = _waitKey(adjusted_ms)
+            t_after = _perf_ns()
+
+            # Slow integer EMA (weight 1/32) for the mean, plus a
+            # matching EMA of the squared deviation for the jitter
+            # estimate
+            overshoot_ns = (t_after - t_before) - adjusted_ms * 1_000_000
+            self._overshoot_avg_ns += (
+                overshoot_ns - self._overshoot_avg_ns) // 32
+            dev = overshoot_ns - self._overshoot_avg_ns
+            self._overshoot_var_ns2 += (
+                dev * dev - self._overshoot_var_ns2) // 32
+            self._overshoot_sigma_ns = math.isqrt(
+                max(0, self._overshoot_var_ns2))
+
+            record(t_after)
+            return raw_key & 0xFF if raw_key >= 0 else -1
+
+        return tick_adaptive
+
+    def _make_hybrid_tick(self):
         """
-        Sleep for bulk of the delay, then busy-wait for precision.
+        Build the HYBRID implementation: sleep for bulk of the delay,
+        then busy-wait for precision.
 
         Strategy:
           1. If remaining > 3ms: cv2.waitKey(remaining - 2ms)
-          2. Busy-wait (spin loop) until exact target time
-          3. This gives ±0.1ms accuracy at the cost of ~1-2% CPU on one core
+          2. Yielding spin (sleep(0) per iteration) until ~0.1ms out,
+             then a bare spin to the exact target time
+          3. This gives ±0.1ms accuracy at ~0.1% CPU — the yield keeps
+             the core available to other threads during the wait
 
         The 2ms safety margin accounts for:
           - OS scheduling jitter (~0.5-1ms)
           - waitKey overhead (~0.1ms)
           - Context switch latency (~0.1-0.5ms)
         """
-        raw_key = -1
-        target_time = self._last_tick + self._frame_duration
-
-        if remaining > 0.003:
-            # Sleep most of the time via waitKey (also processes GUI events)
-            wait_ms = max(1, int((remaining - 0.002) * 1000))
-            raw_key = cv2.waitKey(wait_ms)
-        else:
-            # Still need to call waitKey at least once for GUI events
-            raw_key = cv2.waitKey(1)
-
-        # Busy-wait for final alignment (sub-millisecond precision)
-        while time.perf_counter() < target_time:
-            pass  # spin
-
-        self._last_tick = time.perf_counter()
-        return normalize_key(raw_key)
-
-    def _record_frame(self, now: float) -> None:
+        frame_ns = self._frame_duration_ns
+        record = self._record_frame
+        hr_sleep = self._hr_timer.sleep
+        abs_sleep = nanosleep_until
+        yield_cpu = time.sleep
+        gui_pump_phase = 0
+
+        def tick_hybrid(now_ns: int) -> int:
+            nonlocal gui_pump_phase
+            self._gui_touched = True  # every path below pumps waitKey
+            raw_key = -1
+            target_ns = self._last_tick_ns + frame_ns
+            remaining_ns = target_ns - now_ns
+
+            if remaining_ns > 3_000_000:
+                # Bulk sleep: prefer a precise kernel sleeper — on
+                # Linux an absolute clock_nanosleep deadline (~50µs
+                # slack vs waitKey's ~1.5ms floor), on Windows 10 1803+
+                # the high-resolution waitable timer — then pump GUI
+                # events once. Fall back to waitKey sleeping.
+                if abs_sleep is not None:
+                    abs_sleep(target_ns - 2_000_000)
+                    raw_key = _waitKey(1)
+                elif hr_sleep((remaining_ns - 2_000_000) / 1e9):
+                    raw_key = _waitKey(1)
+                else:
+                    wait_ms = max(1, (remaining_ns - 2_000_000)
+                                  // 1_000_000)
+                    raw_key = _waitKey(wait_ms)
+            else:
+                # Behind schedule (<3ms of budget left): waitKey(1)
+                # here exists only to pump GUI events, yet it still
+                # stalls ≥1ms (up to ~15ms on an unboosted Windows
+                # tick). Pump every 4th such frame — input latency
+                # stays well under perception while the stall cost
+                # amortizes 4×. The bulk-sleep branch above pumps
+                # every frame, so sustained skipping only happens
+                # when rendering eats the whole budget anyway.
+                gui_pump_phase = (gui_pump_phase + 1) & 3
+                if gui_pump_phase == 0:
+                    raw_key = _waitKey(1)
+
+            # Final alignment (sub-millisecond precision). While more
+            # than ~0.1ms remains, sleep(0) each iteration — it
+            # releases the GIL and yields the processor, the
+            # Python-level analogue of a PAUSE/YIELD spin hint, so the
+            # wait doesn't monopolize a core or starve an SMT sibling.
+            # Only the last stretch is a bare spin, keeping CPU
+            # overhead at ~0.1% instead of a full core.
+            while True:
+                now_ns = _perf_ns()
+                if now_ns >= target_ns:
+                    break
+                if target_ns - now_ns > 100_000:
+                    yield_cpu(0)
+
+            record(_perf_ns())
+            return raw_key & 0xFF if raw_key >= 0 else -1
+
+        return tick_hybrid
+
+    def _record_frame(self, now_ns: int) -> None:
         """Update FPS measurement using sliding window."""
-        self._frame_times.append(now)
-        self._last_tick = now
-
-        if len(self._frame_times) >= 2:
-            oldest = self._frame_times[0]
-            elapsed = now - oldest
-            if elapsed > 0:
-                self._fps = (len(self._frame_times) - 1) / elapsed
+        buf = self._ft_buf
+        size = buf.shape[0]
+        buf[self._ft_head] = now_ns
+        self._ft_head = (self._ft_head + 1) % size
+        if self._ft_n < size:
+            self._ft_n += 1
+        self._last_tick_ns = now_ns
+
+        # Shrink the logical window past samples older than 1s so the
+        # reading tracks reality at low frame rates instead of
+        # averaging over the last 128 frames (which could span many
+        # seconds). Pure index arithmetic — zero allocation.
+        cutoff = now_ns - 1_000_000_000
+        n = self._ft_n
+        head = self._ft_head
+        while n > 1 and buf[(head - n) % size] <= cutoff:
+            n -= 1
+        self._ft_n = n
+
+        if n >= 2:
+            elapsed_ns = now_ns - buf[(head - n) % size]
+            if elapsed_ns >= 950_000_000 and n < size:
+                # Steady state: the window covers a full second, so
+                # the sample count IS the FPS — no division needed.
+                self._fps = float(n)
+            elif elapsed_ns > 0:
+                # Warmup (window shorter than 1s) or ring saturated
+                # (>128 FPS): extrapolate from the window endpoints.
+                self._fps = (n - 1) * 1e9 / elapsed_ns
 
     @property
     def fps(self) -> float:
@@ -208,8 +378,28 @@ class FrameTimer:
     @target_fps.setter
     def target_fps(self, value: int) -> None:
         self._target_fps = max(0, value)
-        self._frame_duration = 1.0 / value if value > 0 else 0.0
+        self._frame_duration_ns = (1_000_000_000 // value
+                                   if value > 0 else 0)
+        self._tick_impl = self._select_tick_impl()
+
+    @property
+    def strategy(self) -> TimingStrategy:
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, value: TimingStrategy) -> None:
+        self._strategy = value
+        self._tick_impl = self._select_tick_impl()
 
     def stop(self) -> None:
         """Cleanup. Call when done."""
-        cv2.destroyAllWindows()
+        if self._timer_boost_held:
+            release_timer_resolution()
+            self._timer_boost_held = False
+        self._hr_timer.close()
+        # destroyAllWindows blocks on the GUI event loop flushing
+        # pending destroy events — skip it when no window/event pump
+        # was ever involved (headless benchmarking, externally managed
+        # windows).
+        if self._gui_touched:
+            cv2.destroyAllWindows()
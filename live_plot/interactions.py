@@ -14,6 +14,10 @@ Keyboard Shortcuts (cross-platform):
 
 from __future__ import annotations
 
+import queue
+import shutil
+import subprocess
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -33,14 +37,15 @@ class MouseTracker:
     """
     Tracks mouse position inside an OpenCV window.
 
-    OpenCV mouse callbacks run on the HighGUI thread, same as the
-    thread that called cv2.imshow(). No cross-thread concerns if
-    you read mouse_pos from the same thread.
+    The position is stored as a single packed int ((x << 16) | y, or -1
+    when the cursor is outside the window), so the callback does one
+    atomic attribute store per event — no tuple allocation, and a
+    reader on another thread (async render mode) can never see an x
+    from one event paired with a y from the next.
     """
 
     def __init__(self):
-        self._pos: Optional[tuple[int, int]] = None
-        self._inside = False
+        self._packed = -1      # (x << 16) | y, -1 = outside window
         self._attached_window: Optional[str] = None
 
     def attach(self, window_name: str) -> bool:
@@ -65,47 +70,83 @@ class MouseTracker:
     def _callback(self, event: int, x: int, y: int,
                   flags: int, param) -> None:
         if event == cv2.EVENT_MOUSEMOVE:
-            self._pos = (x, y)
-            self._inside = True
+            self._packed = (x << 16) | (y & 0xFFFF)
         elif event == cv2.EVENT_MOUSELEAVE:
-            self._inside = False
-            self._pos = None
+            self._packed = -1
 
     @property
     def position(self) -> Optional[tuple[int, int]]:
         """Current mouse (x, y) or None if outside window."""
-        return self._pos if self._inside else None
+        packed = self._packed
+        if packed < 0:
+            return None
+        return (packed >> 16, packed & 0xFFFF)
 
 
 # ────────────────────────────────────────────────────────────
 # Screenshot
 # ────────────────────────────────────────────────────────────
+# Directories already created this session — screenshots are often
+# taken in bursts into the same directory, and each mkdir is a syscall.
+_known_dirs: set[str] = set()
+
+
 def save_screenshot(canvas: np.ndarray, directory: str = ".") -> str:
     """
     Save current canvas as PNG with timestamp filename.
 
     Returns the full path of the saved file.
     """
-    path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-    filename = path / f"liveplot_{timestamp}.png"
-    cv2.imwrite(str(filename), canvas)
-    return str(filename)
+    if directory not in _known_dirs:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(directory)
+
+    # time.strftime skips datetime's object construction; milliseconds
+    # come from the fractional part of the same clock read
+    now = time.time()
+    timestamp = "%s_%03d" % (
+        time.strftime("%Y%m%d_%H%M%S", time.localtime(now)),
+        int((now % 1.0) * 1000),
+    )
+    filename = f"{directory}/liveplot_{timestamp}.png"
+    cv2.imwrite(filename, canvas)
+    return filename
 
 
 # ────────────────────────────────────────────────────────────
 # Video Recording
 # ────────────────────────────────────────────────────────────
+# Fallback codecs in order of preference, with their fourcc codes
+# computed once at import instead of per recording start.
+_CODECS: list[tuple[str, int]] = [
+    (name, cv2.VideoWriter_fourcc(*name))
+    for name in ('mp4v', 'avc1', 'XVID')
+]
+
+# Index into _CODECS of the codec that opened successfully last time,
+# so later recording sessions in the same process skip the probe loop
+# (each failed VideoWriter open can cost tens of ms).
+_working_codec_idx: Optional[int] = None
+
+
 class VideoRecorder:
     """
-    Record the plot to an MP4 file using OpenCV VideoWriter.
-
-    Cross-platform codec selection:
-      - Windows: 'mp4v' (MPEG-4) or 'H264' (if available)
-      - Linux: 'mp4v' (MPEG-4) — most universally available
-      - Fallback: 'XVID' (widely supported)
+    Record the plot to an MP4 file.
+
+    Encoder selection, in order of preference:
+      1. Piped ffmpeg subprocess (libx264 ultrafast) — raw BGR frames
+         go down a pipe and a modern encoder runs in its own process,
+         typically 2-4x faster than OpenCV's VideoWriter and off the
+         render loop's critical path (the pipe buffers ~3 frames of
+         slack before a write would block).
+      2. cv2.VideoWriter fallback when ffmpeg is not on PATH:
+         'mp4v' (MPEG-4), 'avc1', then 'XVID'.
+
+    Either way, encoding runs on a worker thread behind a 3-frame
+    bounded queue: write_frame() is a constant-time enqueue, so an
+    encoder stall (H.264 keyframes can take 10-50ms) never blocks the
+    render loop. When the queue is full the oldest frame is dropped —
+    the recording loses a frame rather than the display stuttering.
     """
 
     def __init__(self, width: int, height: int, fps: float = 30.0,
@@ -115,8 +156,11 @@ class VideoRecorder:
         self._fps = fps
         self._directory = directory
         self._writer: Optional[cv2.VideoWriter] = None
+        self._proc: Optional[subprocess.Popen] = None
         self._filepath: Optional[str] = None
         self._recording = False
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
 
     def start(self) -> str:
         """Start recording. Returns filepath."""
@@ -126,35 +170,133 @@ class VideoRecorder:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._filepath = str(path / f"liveplot_{timestamp}.mp4")
 
-        # Try codecs in order of preference
-        codecs = ['mp4v', 'avc1', 'XVID']
-        for codec in codecs:
-            fourcc = cv2.VideoWriter_fourcc(*codec)
+        if self._start_ffmpeg():
+            self._start_worker()
+            self._recording = True
+            return self._filepath
+
+        # Fallback: OpenCV VideoWriter, trying codecs in order. A known
+        # working codec from a previous session is tried first.
+        global _working_codec_idx
+        order = list(range(len(_CODECS)))
+        if _working_codec_idx is not None:
+            order.remove(_working_codec_idx)
+            order.insert(0, _working_codec_idx)
+        for idx in order:
+            _, fourcc = _CODECS[idx]
             self._writer = cv2.VideoWriter(
                 self._filepath, fourcc, self._fps,
                 (self._width, self._height)
             )
             if self._writer.isOpened():
+                _working_codec_idx = idx
+                self._start_worker()
                 self._recording = True
                 return self._filepath
             self._writer.release()
 
         raise RuntimeError(
-            f"No suitable video codec found. Tried: {codecs}. "
+            f"No suitable video codec found. Tried: {[n for n, _ in _CODECS]}. "
             f"Install ffmpeg: sudo apt install ffmpeg (Linux) / choco install ffmpeg (Windows)"
         )
 
-    def write_frame(self, frame: np.ndarray) -> None:
-        """Write a frame. No-op if not recording."""
-        if self._recording and self._writer is not None:
+    def _start_ffmpeg(self) -> bool:
+        """Spawn the piped ffmpeg encoder. Returns False to fall back."""
+        if shutil.which('ffmpeg') is None:
+            return False
+        frame_bytes = self._width * self._height * 3
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            '-s', f'{self._width}x{self._height}',
+            '-r', f'{self._fps:g}', '-i', '-',
+            '-c:v', 'libx264', '-preset', 'ultrafast',
+            '-pix_fmt', 'yuv420p',
+            self._filepath,
+        ]
+        try:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=frame_bytes * 3,   # ~3 frames of pipe slack
+            )
+            return True
+        except OSError:
+            self._proc = None
+            return False
+
+    def _start_worker(self) -> None:
+        """Spin up the encode thread behind a small bounded queue."""
+        self._queue = queue.Queue(maxsize=3)
+        self._worker = threading.Thread(
+            target=self._encode_loop, name="liveplot-encoder", daemon=True,
+        )
+        self._worker.start()
+
+    def _encode_loop(self) -> None:
+        """Worker: drain the queue into the encoder. None = shutdown."""
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            self._write_sync(frame)
+
+    def _write_sync(self, frame: np.ndarray) -> None:
+        """Blocking encoder write, worker-thread only."""
+        if self._proc is not None:
+            try:
+                # Queued frames are C-contiguous copies, so the pipe can
+                # read straight out of the array — tobytes() would clone
+                # the whole frame (~1 MB at 800x480) per write
+                self._proc.stdin.write(memoryview(frame))
+            except (BrokenPipeError, OSError):
+                # Encoder died mid-run — flag it off; stop() cleans up
+                self._recording = False
+        elif self._writer is not None:
             self._writer.write(frame)
 
+    def write_frame(self, frame: np.ndarray) -> None:
+        """Enqueue a frame for encoding. No-op if not recording.
+
+        Constant-time: copies the frame (the caller reuses its canvas
+        buffer) and enqueues; when the encoder is behind, the oldest
+        queued frame is dropped instead of blocking the caller.
+        """
+        if not self._recording or self._queue is None:
+            return
+        snapshot = frame.copy()
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()    # drop oldest
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(snapshot)
+            except queue.Full:
+                pass
+
     def stop(self) -> Optional[str]:
-        """Stop recording. Returns filepath or None."""
+        """Stop recording. Flushes queued frames, returns filepath."""
+        self._recording = False
+        if self._worker is not None:
+            self._queue.put(None)           # sentinel after queued frames
+            self._worker.join(timeout=5.0)
+            self._worker = None
+            self._queue = None
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5.0)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
         if self._writer is not None:
             self._writer.release()
             self._writer = None
-        self._recording = False
         return self._filepath
 
     @property
@@ -169,9 +311,14 @@ class VideoRecorder:
 # ────────────────────────────────────────────────────────────
 # Keyboard Action Dispatcher
 # ────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KeyAction:
-    """Result of processing a key press."""
+    """Result of processing a key press.
+
+    Frozen + slotted: instances are the shared, prebuilt entries of the
+    dispatch table below, so immutability is enforced rather than just
+    documented, and there is no per-instance __dict__.
+    """
     quit: bool = False
     toggle_pause: bool = False
     screenshot: bool = False
@@ -182,32 +329,33 @@ class KeyAction:
     status_message: str = ""
 
 
+# Key → action dispatch table, built once at import. Actions are
+# shared prebuilt instances (callers only read them), so a keypress is
+# one dict probe with no allocation — the elif chain this replaces
+# recomputed every ord() per call.
+_EMPTY_ACTION = KeyAction()
+
+_KEY_TABLE: dict[int, KeyAction] = {
+    ord('q'): KeyAction(quit=True),
+    27: KeyAction(quit=True),               # ESC
+    ord('p'): KeyAction(toggle_pause=True),
+    32: KeyAction(toggle_pause=True),       # Space
+    ord('s'): KeyAction(screenshot=True),
+    ord('r'): KeyAction(reset=True),
+    ord('v'): KeyAction(toggle_recording=True),
+    ord('t'): KeyAction(cycle_theme=True),
+    ord('+'): KeyAction(fps_delta=10),
+    ord('='): KeyAction(fps_delta=10),
+    ord('-'): KeyAction(fps_delta=-10),
+    ord('_'): KeyAction(fps_delta=-10),
+}
+
+
 def process_key(key: int) -> KeyAction:
     """
     Map a normalized key code to an action.
 
     Uses normalized 8-bit key codes (already masked by normalize_key).
+    Returns a shared, immutable KeyAction.
     """
-    if key < 0:
-        return KeyAction()
-
-    action = KeyAction()
-
-    if key == ord('q') or key == 27:       # Q or ESC
-        action.quit = True
-    elif key == ord('p') or key == 32:     # P or Space
-        action.toggle_pause = True
-    elif key == ord('s'):
-        action.screenshot = True
-    elif key == ord('r'):
-        action.reset = True
-    elif key == ord('v'):
-        action.toggle_recording = True
-    elif key == ord('t'):
-        action.cycle_theme = True
-    elif key == ord('+') or key == ord('='):
-        action.fps_delta = 10
-    elif key == ord('-') or key == ord('_'):
-        action.fps_delta = -10
-
-    return action
+    return _KEY_TABLE.get(key, _EMPTY_ACTION)
@@ -35,7 +35,10 @@ After boost: time.sleep(0.001) → ~1-2ms, waitKey(1) → ~1-2ms
 from __future__ import annotations
 
 import ctypes
+import functools
+import os
 import platform
+import time
 import warnings
 from typing import Optional
 
@@ -56,6 +59,18 @@ class PlatformInfo:
         return f"{cls.OS} {cls.ARCH} | Python {'.'.join(map(str, cls.PY_VERSION))}"
 
 
+@functools.cache
+def is_wayland_session() -> bool:
+    """True if running under a Linux Wayland session.
+
+    Cached so the package __init__ and apply_platform_fixes() share one
+    probe instead of each re-reading the environment (and, before
+    PlatformInfo, re-running uname via platform.system()).
+    """
+    return (PlatformInfo.IS_LINUX
+            and os.environ.get('XDG_SESSION_TYPE', '').lower() == 'wayland')
+
+
 # ────────────────────────────────────────────────────────────
 # Windows Timer Resolution
 # ────────────────────────────────────────────────────────────
@@ -78,63 +93,117 @@ class _TimerResolution:
     """
 
     _boosted: bool = False
-    _ntdll: Optional[ctypes.WinDLL] = None  # type: ignore[assignment]
+    _set_fn = None           # NtSetTimerResolution, resolved once
+    _query_fn = None         # NtQueryTimerResolution, resolved once
+    _resolved: bool = False
     _previous_resolution: int = 0
+    _refcount: int = 0
 
     @classmethod
-    def boost(cls) -> bool:
-        """
-        Request 1ms timer resolution. Returns True if successful.
-        Safe to call multiple times — idempotent.
+    def _resolve(cls) -> bool:
+        """Resolve the ntdll entry points once, with explicit
+        argtypes/restype.
+
+        Attribute access on a WinDLL does a GetProcAddress per lookup;
+        caching the function pointers lets query_resolution_100ns() be
+        called repeatedly (e.g. to monitor the achieved granularity)
+        at the cost of a plain ctypes call.
         """
-        if cls._boosted or not PlatformInfo.IS_WINDOWS:
-            return cls._boosted
-
+        if cls._resolved:
+            return cls._set_fn is not None
+        cls._resolved = True
+        if not PlatformInfo.IS_WINDOWS:
+            return False
         try:
             ntdll = ctypes.WinDLL('ntdll.dll')
-            current = ctypes.c_ulong()
-
-            # Request 1ms (10000 × 100ns = 1,000,000ns = 1ms)
-            status = ntdll.NtSetTimerResolution(
-                ctypes.c_ulong(10000),   # desired: 1.0ms
-                ctypes.c_long(1),        # set = True
-                ctypes.byref(current)    # output: actual
-            )
-
-            if status == 0:  # STATUS_SUCCESS
-                cls._ntdll = ntdll
-                cls._previous_resolution = current.value
-                cls._boosted = True
-                actual_ms = current.value / 10000.0
-                return True
-            else:
-                warnings.warn(
-                    f"NtSetTimerResolution failed (status=0x{status:08X}). "
-                    f"Frame timing may be inconsistent on Windows.",
-                    RuntimeWarning, stacklevel=2
-                )
-                return False
-
+            set_fn = ntdll.NtSetTimerResolution
+            set_fn.argtypes = [ctypes.c_ulong, ctypes.c_long,
+                               ctypes.POINTER(ctypes.c_ulong)]
+            set_fn.restype = ctypes.c_long
+            query_fn = ntdll.NtQueryTimerResolution
+            query_fn.argtypes = [ctypes.POINTER(ctypes.c_ulong),
+                                 ctypes.POINTER(ctypes.c_ulong),
+                                 ctypes.POINTER(ctypes.c_ulong)]
+            query_fn.restype = ctypes.c_long
+            cls._set_fn = set_fn
+            cls._query_fn = query_fn
+            return True
         except (OSError, AttributeError) as e:
             warnings.warn(
                 f"Cannot access ntdll.dll: {e}. "
                 f"Frame timing may be inconsistent on Windows.",
-                RuntimeWarning, stacklevel=2
+                RuntimeWarning, stacklevel=3
             )
             return False
 
+    @classmethod
+    def query_resolution_100ns(cls) -> int:
+        """Current actual timer resolution in 100ns units (0 = unknown).
+
+        Cheap enough to poll: one pre-resolved ctypes call, no DLL or
+        symbol lookup.
+        """
+        if not cls._resolve() or cls._query_fn is None:
+            return 0
+        minimum = ctypes.c_ulong()
+        maximum = ctypes.c_ulong()
+        current = ctypes.c_ulong()
+        if cls._query_fn(ctypes.byref(minimum), ctypes.byref(maximum),
+                         ctypes.byref(current)) == 0:
+            return current.value
+        return 0
+
+    @classmethod
+    def acquire(cls) -> bool:
+        """Refcounted boost — pair every acquire() with a release().
+
+        The raised timer interrupt costs ~1-3% battery on laptops, so
+        it should be held only while something actually needs it (an
+        active FrameTimer) rather than for the whole process lifetime.
+        """
+        cls._refcount += 1
+        return cls.boost()
+
+    @classmethod
+    def release(cls) -> None:
+        """Drop one reference; restores resolution at zero."""
+        if cls._refcount > 0:
+            cls._refcount -= 1
+        if cls._refcount == 0:
+            cls.restore()
+
+    @classmethod
+    def boost(cls) -> bool:
+        """
+        Request 1ms timer resolution. Returns True if successful.
+        Safe to call multiple times — idempotent.
+        """
+        if cls._boosted or not cls._resolve():
+            return cls._boosted
+
+        current = ctypes.c_ulong()
+        # Request 1ms (10000 × 100ns = 1,000,000ns = 1ms)
+        status = cls._set_fn(10000, 1, ctypes.byref(current))
+        if status == 0:  # STATUS_SUCCESS
+            cls._previous_resolution = current.value
+            cls._boosted = True
+            return True
+        warnings.warn(
+            f"NtSetTimerResolution failed (status=0x{status:08X}). "
+            f"Frame timing may be inconsistent on Windows.",
+            RuntimeWarning, stacklevel=2
+        )
+        return False
+
     @classmethod
     def restore(cls) -> None:
         """Restore original timer resolution. Call on shutdown."""
-        if not cls._boosted or cls._ntdll is None:
+        if not cls._boosted or cls._set_fn is None:
             return
         try:
             current = ctypes.c_ulong()
-            cls._ntdll.NtSetTimerResolution(
-                ctypes.c_ulong(cls._previous_resolution),
-                ctypes.c_long(0),  # set = False (release)
-                ctypes.byref(current)
-            )
+            cls._set_fn(cls._previous_resolution, 0,  # set=False (release)
+                        ctypes.byref(current))
         except Exception:
             pass
         finally:
@@ -146,6 +215,158 @@ class _TimerResolution:
         return cls._boosted
 
 
+# ────────────────────────────────────────────────────────────
+# High-Resolution Waitable Timer (Windows 10 1803+)
+# ────────────────────────────────────────────────────────────
+class HighResWaitableTimer:
+    """
+    Wrapper around CREATE_WAITABLE_TIMER_HIGH_RESOLUTION.
+
+    On Windows 10 1803+ this kernel object fires with sub-millisecond
+    accuracy regardless of the global 64 Hz timer tick — unlike
+    time.sleep()/waitKey(n), which are quantized to it even after the
+    NtSetTimerResolution boost. Used by FrameTimer for the bulk sleep
+    in the HYBRID strategy.
+
+    On other platforms (or when creation fails) `available` is False
+    and callers fall back to their waitKey-based sleep.
+    """
+
+    _CREATE_HIGH_RESOLUTION = 0x00000002
+    _TIMER_ALL_ACCESS = 0x1F0003
+    _INFINITE = 0xFFFFFFFF
+
+    def __init__(self):
+        self._handle = None
+        self._kernel32 = None
+        if not PlatformInfo.IS_WINDOWS:
+            return
+        try:
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            handle = kernel32.CreateWaitableTimerExW(
+                None, None,
+                self._CREATE_HIGH_RESOLUTION,
+                self._TIMER_ALL_ACCESS,
+            )
+            if handle:  # 0/None on pre-1803 Windows
+                self._kernel32 = kernel32
+                self._handle = handle
+        except (OSError, AttributeError):
+            self._handle = None
+
+    @property
+    def available(self) -> bool:
+        return self._handle is not None
+
+    def sleep(self, seconds: float) -> bool:
+        """Block for `seconds` with sub-ms accuracy.
+
+        Returns False if the timer is unavailable or arming failed —
+        the caller should fall back to its coarse sleep.
+        """
+        if self._handle is None or seconds <= 0:
+            return False
+        # Negative due time = relative, in 100ns units
+        due = ctypes.c_longlong(-int(seconds * 1e7))
+        ok = self._kernel32.SetWaitableTimer(
+            self._handle, ctypes.byref(due), 0, None, None, 0)
+        if not ok:
+            return False
+        self._kernel32.WaitForSingleObject(self._handle, self._INFINITE)
+        return True
+
+    def close(self) -> None:
+        if self._handle is not None:
+            try:
+                self._kernel32.CloseHandle(self._handle)
+            except OSError:
+                pass
+            self._handle = None
+
+
+# ────────────────────────────────────────────────────────────
+# NTP-immune monotonic clock (Linux)
+# ────────────────────────────────────────────────────────────
+class _Timespec(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+def _resolve_monotonic_raw_ns():
+    """Build monotonic_raw_ns for this platform.
+
+    On Linux, time.perf_counter_ns maps to CLOCK_MONOTONIC, which NTP
+    slews (~1e-5 rate adjustments) — harmless for pacing, but visible
+    to measurement over seconds. CLOCK_MONOTONIC_RAW reads the same
+    hardware counter unslewed. On Windows/macOS perf_counter is already
+    backed by a raw hardware counter, so the stdlib call is returned
+    as-is. Note the ctypes round-trip costs ~1µs per call vs ~50ns for
+    perf_counter_ns — worth it for measurement, not for pacing.
+    """
+    if PlatformInfo.IS_LINUX:
+        CLOCK_MONOTONIC_RAW = 4
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            clock_gettime = libc.clock_gettime
+            probe = _Timespec()
+            if clock_gettime(CLOCK_MONOTONIC_RAW,
+                             ctypes.byref(probe)) == 0:
+                def monotonic_raw_ns(_gettime=clock_gettime,
+                                     _ts=_Timespec(),
+                                     _byref=ctypes.byref) -> int:
+                    _gettime(4, _byref(_ts))
+                    return _ts.tv_sec * 1_000_000_000 + _ts.tv_nsec
+                return monotonic_raw_ns
+        except (OSError, AttributeError):
+            pass
+    return time.perf_counter_ns
+
+
+#: NTP-immune nanosecond clock; falls back to time.perf_counter_ns
+#: where CLOCK_MONOTONIC_RAW is unavailable (non-Linux).
+monotonic_raw_ns = _resolve_monotonic_raw_ns()
+
+
+def _resolve_nanosleep_until():
+    """Build an absolute-deadline sleeper (Linux only, else None).
+
+    clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) wakes at a fixed
+    point on the CLOCK_MONOTONIC timeline — the same timeline Linux
+    backs time.perf_counter_ns with — instead of sleeping a relative
+    duration computed from an already-stale clock read. The kernel
+    timer slack for a normal process is ~50µs, well under the ~1.5ms
+    granularity cv2.waitKey offers for pacing, and the deadline form
+    cannot accumulate the read→sleep gap as drift.
+    """
+    if not PlatformInfo.IS_LINUX:
+        return None
+    CLOCK_MONOTONIC = 1
+    TIMER_ABSTIME = 1
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        clock_nanosleep = libc.clock_nanosleep
+        # Probe with an already-expired deadline: returns 0 immediately
+        if clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME,
+                           ctypes.byref(_Timespec()), None) != 0:
+            return None
+    except (OSError, AttributeError):
+        return None
+
+    def nanosleep_until(deadline_ns: int,
+                        _sleep=clock_nanosleep,
+                        _ts=_Timespec(),
+                        _byref=ctypes.byref) -> None:
+        _ts.tv_sec = deadline_ns // 1_000_000_000
+        _ts.tv_nsec = deadline_ns % 1_000_000_000
+        _sleep(CLOCK_MONOTONIC, TIMER_ABSTIME, _byref(_ts), None)
+
+    return nanosleep_until
+
+
+#: Sleep until an absolute perf_counter_ns deadline, or None where
+#: clock_nanosleep is unavailable (non-Linux).
+nanosleep_until = _resolve_nanosleep_until()
+
+
 # ────────────────────────────────────────────────────────────
 # HiDPI Awareness (Windows)
 # ────────────────────────────────────────────────────────────
@@ -185,6 +406,21 @@ def enable_hidpi_awareness() -> bool:
 # ────────────────────────────────────────────────────────────
 # Cross-Platform Key Code Normalization
 # ────────────────────────────────────────────────────────────
+def boost_timer_resolution() -> bool:
+    """Acquire a reference on the 1ms Windows timer resolution.
+
+    Scoped, not process-lifetime: call release_timer_resolution() when
+    the frame loop stops so laptops drop back to the power-friendly
+    64 Hz tick. No-op (returns False) off Windows.
+    """
+    return _TimerResolution.acquire()
+
+
+def release_timer_resolution() -> None:
+    """Release one boost_timer_resolution() reference."""
+    _TimerResolution.release()
+
+
 def normalize_key(raw_key: int) -> int:
     """
     Normalize cv2.waitKey() return value across platforms.
@@ -221,8 +457,6 @@ def apply_platform_fixes() -> dict:
             'qt_backend_fixed': False,
         }
     """
-    import os
-
     result = {
         'os': PlatformInfo.OS,
         'timer_boosted': False,
@@ -231,22 +465,39 @@ def apply_platform_fixes() -> dict:
     }
 
     if PlatformInfo.IS_WINDOWS:
-        result['timer_boosted'] = _TimerResolution.boost()
+        result['timer_boosted'] = _TimerResolution.acquire()
         result['hidpi_set'] = enable_hidpi_awareness()
 
     if PlatformInfo.IS_LINUX:
         # OpenCV Qt backend may fail to find the Wayland plugin.
-        # If XDG_SESSION_TYPE is wayland and QT_QPA_PLATFORM is not set,
+        # If the session is Wayland and QT_QPA_PLATFORM is not set,
         # force xcb (X11 compatibility layer via XWayland) to avoid:
         #   "Could not find the Qt platform plugin 'wayland'"
-        session = os.environ.get('XDG_SESSION_TYPE', '').lower()
-        if session == 'wayland' and 'QT_QPA_PLATFORM' not in os.environ:
+        if is_wayland_session() and 'QT_QPA_PLATFORM' not in os.environ:
             os.environ['QT_QPA_PLATFORM'] = 'xcb'
             result['qt_backend_fixed'] = True
 
     return result
 
 
+def set_cpu_affinity(cpus: set) -> bool:
+    """Pin this process to a fixed set of CPU cores (Linux only).
+
+    Keeps the render loop and the HighGUI event thread on the same few
+    cores so the scheduler stops migrating them — each migration lands
+    the next frame on a cold cache. Returns True if the affinity was
+    applied. No-op (False) where sched_setaffinity is unavailable or
+    the requested set is invalid.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return False
+    try:
+        os.sched_setaffinity(0, cpus)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
 def cleanup_platform() -> None:
     """Restore platform state. Call on exit."""
-    _TimerResolution.restore()
+    _TimerResolution.release()
@@ -1,25 +1,39 @@
 """
 Series — Circular buffer data container with O(1) push and built-in statistics.
 
-Circular Buffer Mechanism:
-==========================
-Fixed-size numpy array with a write head that wraps around.
-When buffer is full, oldest data is silently overwritten.
+Mirrored Circular Buffer Mechanism:
+===================================
+Fixed-size numpy array doubled to 2×buffer_size ("ghost region" trick).
+Every sample is written twice — at head and at head+N — so the last
+`count` samples in chronological order are ALWAYS a contiguous slice:
+
+    Buffer: [ d  e  f  g | a  b  c  d ]      (N=4, head=3)
+              ─ primary ─   ─ mirror ─
+    Window: buffer[head-count+N : head+N]  →  a b c d   (zero-copy view)
 
-    Buffer: [ d  e  f  g  a  b  c ]
-                              ↑ head=4
-    Logical order: a b c d e f g
-    get_data() uses np.roll(-head) to unwrap.
+When buffer is full, oldest data is silently overwritten.
 
 Performance vs list:
     list.append + list.pop(0)  →  O(n) per pop (shift all elements)
-    circular buffer push       →  O(1) always (write at head, increment)
-    For buffer_size=1000: circular is ~100x faster per push.
+    circular buffer push       →  O(1) always (two writes, increment)
+    Unwrapping for the renderer →  O(1) slice — no np.roll, and no
+                                   np.concatenate of the two halves
+                                   either: the mirror IS the unwrap.
+
+The backing array is allocated once and never moves, so every window
+the renderer sees is a C-contiguous view at a stable base address —
+compiled kernels (Numba) and vectorized numpy passes hit the same
+memory every frame instead of chasing fresh copies.
 
 Memory:
     Uses __slots__ to eliminate per-instance __dict__ overhead.
-    Each Series: buffer_size × 8 bytes (float64) + ~64 bytes overhead.
-    1000-point series = ~8 KB.
+    Each Series: buffer_size × 8 bytes (float32 × 2 copies) + ~64 bytes.
+    1000-point series = ~8 KB — the mirrored layout costs no more than
+    a single float64 copy, and the render path stays copy-free.
+    float32 is plenty: values end up as integer pixel rows, and halving
+    the element size halves memory bandwidth in every full-window pass
+    (projection, isnan, nanmin/nanmax) while the running statistics
+    stay float64 for stability.
 """
 
 from __future__ import annotations
@@ -31,59 +45,261 @@ import numpy as np
 
 from .config import SeriesConfig
 
+try:
+    from numba import njit as _njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+def _neumaier_add(s: float, c: float, d: float) -> tuple[float, float]:
+    """One Neumaier compensated-summation step: (s, c) += d.
+
+    Plain running sums drift unboundedly over millions of pushes —
+    each add/subtract of a sample rounds, and the sliding-window
+    subtract-old/add-new pattern cancels catastrophically once the sum
+    dwarfs individual samples. The compensation term captures the
+    rounding error of every step for one extra add and a compare.
+    """
+    t = s + d
+    if abs(s) >= abs(d):
+        c += (s - t) + d
+    else:
+        c += (d - t) + s
+    return t, c
+
+
+if _HAVE_NUMBA:
+    _neumaier_add = _njit(cache=True)(_neumaier_add)
+
+    @_njit(cache=True)
+    def _fast_push(buf, size, head, count, nvalid,
+                   run_sum, sum_c, run_sq, sq_c, value):
+        """Compiled push body: sanitize, stats, mirrored dual-write.
+
+        Runs the whole per-sample path as one machine-code call
+        (~tens of ns) instead of ~10 interpreted bytecode steps.
+        Returns the updated
+        (head, count, nvalid, run_sum, sum_c, run_sq, sq_c).
+        """
+        if math.isnan(value) or math.isinf(value):
+            value = np.nan
+        # Quantize through float32 before accumulating: the buffer
+        # stores float32, so the value subtracted when this slot is
+        # overwritten must be bit-identical to the value added now or
+        # the compensated sums drift by v - float32(v) per sample.
+        value = np.float64(np.float32(value))
+        if count >= size:
+            # float64 up front so old * old is the same float64
+            # product the add side accumulated.
+            old = np.float64(buf[head])
+            if not math.isnan(old):
+                nvalid -= 1
+                run_sum, sum_c = _neumaier_add(run_sum, sum_c, -old)
+                run_sq, sq_c = _neumaier_add(run_sq, sq_c, -(old * old))
+        if not math.isnan(value):
+            nvalid += 1
+            run_sum, sum_c = _neumaier_add(run_sum, sum_c, value)
+            run_sq, sq_c = _neumaier_add(run_sq, sq_c, value * value)
+        buf[head] = value
+        buf[head + size] = value
+        head = (head + 1) % size
+        if count < size:
+            count += 1
+        return head, count, nvalid, run_sum, sum_c, run_sq, sq_c
+
 
 class Series:
     """A single data series backed by a circular buffer."""
 
-    __slots__ = ('config', '_buffer', '_size', '_head', '_count',
-                 '_running_sum', '_running_sq_sum')
+    __slots__ = ('config', 'palette_index', '_buffer', '_size', '_head',
+                 '_count', '_pts', '_valid', '_glow',
+                 '_running_sum', '_running_sq_sum', '_sum_c', '_sqsum_c',
+                 '_valid_n')
 
     def __init__(self, config: SeriesConfig, buffer_size: int):
         self.config = config
         self._size = buffer_size
-        self._buffer = np.full(buffer_size, np.nan, dtype=np.float64)
+        # Mirrored ring: sample i lives at [i] and [i + size] so any
+        # chronological window is one contiguous slice.
+        self._buffer = np.full(buffer_size * 2, np.nan, dtype=np.float32)
         self._head = 0
         self._count = 0
 
-        # Running statistics (for O(1) mean/std if needed)
+        # Projection scratch, filled in place by the renderer each
+        # frame (pixel coords + validity mask) — no per-frame allocs.
+        self._pts = np.empty((buffer_size, 2), dtype=np.int32)
+        self._valid = np.empty(buffer_size, dtype=np.bool_)
+
+        # Cached glow tint, derived from config.color on demand
+        self._glow: Optional[tuple[int, int, int]] = None
+
+        # Index into the theme palette when the color was auto-assigned
+        # (None = user-chosen color). Lets theme switches re-tint the
+        # series from the new palette instead of keeping stale colors.
+        self.palette_index: Optional[int] = None
+
+        # Running statistics for O(1) mean/std. Neumaier-compensated:
+        # the _c terms accumulate the rounding error of every
+        # add/subtract so long-running monitors don't drift.
         self._running_sum = 0.0
         self._running_sq_sum = 0.0
+        self._sum_c = 0.0
+        self._sqsum_c = 0.0
+
+        # Non-NaN samples currently stored, maintained alongside the
+        # running sums so valid_count never rescans the buffer.
+        self._valid_n = 0
 
     def push(self, value: float) -> None:
         """Add a value. Handles None, NaN, inf gracefully."""
-        if value is None:
+        try:
+            clean = float(value)   # None raises TypeError like any junk
+        except (TypeError, ValueError):
             clean = np.nan
-        elif isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        if clean - clean != 0.0:
+            # Single fused sanitizer: NaN-NaN and inf-inf are both NaN,
+            # any finite value gives exactly 0.0 — one compare replaces
+            # the isnan/isinf pair
             clean = np.nan
-        else:
-            try:
-                clean = float(value)
-                # Also catch numpy inf/nan for non-float inputs
-                if math.isnan(clean) or math.isinf(clean):
-                    clean = np.nan
-            except (ValueError, TypeError):
-                clean = np.nan
+        # Round through float32 so the stats add exactly what the
+        # buffer stores — the subtract-old path reads the float32
+        # slot back, and any mismatch leaks into the running sums.
+        clean = float(np.float32(clean))
+
+        if _HAVE_NUMBA:
+            # Compiled fast path: the sanitize/stats/write sequence is
+            # one native call (NaN/inf handled inside the kernel)
+            (self._head, self._count, self._valid_n,
+             self._running_sum, self._sum_c,
+             self._running_sq_sum, self._sqsum_c) = _fast_push(
+                self._buffer, self._size, self._head, self._count,
+                self._valid_n, self._running_sum, self._sum_c,
+                self._running_sq_sum, self._sqsum_c, clean)
+            return
 
         # Update running stats: subtract old value if overwriting
         if self._count >= self._size:
             old = self._buffer[self._head]
             if not math.isnan(old):
-                self._running_sum -= old
-                self._running_sq_sum -= old * old
+                old = float(old)
+                self._valid_n -= 1
+                self._running_sum, self._sum_c = _neumaier_add(
+                    self._running_sum, self._sum_c, -old)
+                self._running_sq_sum, self._sqsum_c = _neumaier_add(
+                    self._running_sq_sum, self._sqsum_c, -(old * old))
 
         if not math.isnan(clean):
-            self._running_sum += clean
-            self._running_sq_sum += clean * clean
+            self._valid_n += 1
+            self._running_sum, self._sum_c = _neumaier_add(
+                self._running_sum, self._sum_c, clean)
+            self._running_sq_sum, self._sqsum_c = _neumaier_add(
+                self._running_sq_sum, self._sqsum_c, clean * clean)
 
         self._buffer[self._head] = clean
+        self._buffer[self._head + self._size] = clean
         self._head = (self._head + 1) % self._size
         self._count = min(self._count + 1, self._size)
 
+    def extend(self, values) -> None:
+        """Bulk append a 1-D array of values in one vectorized pass.
+
+        Equivalent to calling push() per element but sanitizes
+        NaN/inf with a single np.isfinite and writes the chunk with
+        fancy indexing. Chunks longer than the buffer keep only the
+        trailing buffer_size samples.
+        """
+        arr = np.asarray(values, dtype=np.float32).ravel()
+        n = len(arr)
+        if n == 0:
+            return
+
+        clean = np.where(np.isfinite(arr), arr, np.nan)
+        if n > self._size:
+            clean = clean[-self._size:]
+            n = self._size
+
+        head, size = self._head, self._size
+        buf = self._buffer
+        first = min(n, size - head)
+        rest = n - first
+
+        # Update running stats: subtract overwritten values, add new
+        # ones. nansum skips NaN (empty slots hold NaN) without
+        # building masks or filtered copies, and the overwritten
+        # region is just two contiguous slices.
+        old1 = buf[head:head + first]
+        old2 = buf[:rest]
+        self._valid_n += (int(np.count_nonzero(~np.isnan(clean)))
+                          - int(np.count_nonzero(~np.isnan(old1)))
+                          - int(np.count_nonzero(~np.isnan(old2))))
+        self._running_sum, self._sum_c = _neumaier_add(
+            self._running_sum, self._sum_c,
+            float(np.nansum(clean))
+            - float(np.nansum(old1))
+            - float(np.nansum(old2)))
+        self._running_sq_sum, self._sqsum_c = _neumaier_add(
+            self._running_sq_sum, self._sqsum_c,
+            float(np.nansum(clean * clean))
+            - float(np.nansum(old1 * old1))
+            - float(np.nansum(old2 * old2)))
+
+        # At most two contiguous copies per half (plus mirrors) — no
+        # index array, no vectorized modulo.
+        buf[head:head + first] = clean[:first]
+        buf[head + size:head + size + first] = clean[:first]
+        if rest:
+            buf[:rest] = clean[first:]
+            buf[size:size + rest] = clean[first:]
+
+        self._head = (head + n) % size
+        self._count = min(self._count + n, size)
+
+    # Alias: the batch-ingest name used by ring-buffer libraries
+    push_many = extend
+
+    def _window(self) -> np.ndarray:
+        """Zero-copy chronological view of the stored samples."""
+        start = self._head - self._count + self._size
+        return self._buffer[start:start + self._count]
+
     def get_data(self) -> np.ndarray:
-        """Return data in chronological order (oldest → newest)."""
-        if self._count < self._size:
-            return self._buffer[:self._count].copy()
-        return np.roll(self._buffer, -self._head).copy()
+        """Return data in chronological order (oldest → newest).
+
+        Zero-copy: this is a read-only window into the mirrored ring,
+        valid until the next push()/extend(). The renderer fetches it
+        once per frame and shares the same view between the line draw
+        and the tooltip lookup; .copy() it if you need a snapshot that
+        survives further pushes. (A two-slice head/tail view API is
+        unnecessary here — the mirror makes the window one slice.)
+        """
+        return self._window()
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """Change the series color, invalidating the cached glow tint."""
+        self.config.color = color
+        self.config.refresh_color()
+        self._glow = None
+
+    @property
+    def glow_color(self) -> tuple[int, int, int]:
+        """Darkened halo tint for the latest-point glow.
+
+        Computed once per color change instead of rebuilding the tuple
+        in the draw path.
+        """
+        if self._glow is None:
+            self._glow = tuple(max(0, min(255, c // 3))
+                               for c in self.config.color)
+        return self._glow
+
+    def point_scratch(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """Reusable (points[n, 2] int32, valid[n] bool) scratch views.
+
+        Owned by the series so the renderer can project into them
+        without allocating; contents are overwritten every frame.
+        """
+        return self._pts[:n], self._valid[:n]
 
     @property
     def latest(self) -> float:
@@ -98,20 +314,62 @@ class Series:
         """Number of data points stored (up to buffer_size)."""
         return self._count
 
+    @property
+    def capacity(self) -> int:
+        """Configured buffer_size (max points stored)."""
+        return self._size
+
     @property
     def valid_count(self) -> int:
-        """Number of non-NaN data points."""
-        if self._count < self._size:
-            return int(np.count_nonzero(~np.isnan(self._buffer[:self._count])))
-        return int(np.count_nonzero(~np.isnan(self._buffer)))
+        """Number of non-NaN data points.
+
+        O(1): maintained incrementally by the push/extend paths (same
+        pattern as the running sums) instead of rescanning the buffer.
+        """
+        return self._valid_n
+
+    @property
+    def mean(self) -> float:
+        """Mean of valid samples from the compensated running sum.
+
+        O(1): both the sum and the valid-sample count are maintained
+        incrementally (NaNs are excluded from the running stats).
+        """
+        n = self.valid_count
+        if n == 0:
+            return np.nan
+        return (self._running_sum + self._sum_c) / n
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation from the running sums."""
+        n = self.valid_count
+        if n == 0:
+            return np.nan
+        m = (self._running_sum + self._sum_c) / n
+        var = (self._running_sq_sum + self._sqsum_c) / n - m * m
+        return math.sqrt(var) if var > 0.0 else 0.0
 
     def get_min_max(self) -> tuple[float, float]:
-        """Return (min, max) of valid data. Returns (nan, nan) if no data."""
-        data = self._buffer[:self._count] if self._count < self._size else self._buffer
-        valid = data[~np.isnan(data)]
-        if len(valid) == 0:
+        """Return (min, max) of valid data. Returns (nan, nan) if no
+        valid data.
+
+        Uses nanmin/nanmax directly on the window — one C pass each,
+        no mask or filtered-array temporaries (the auto-scale path
+        calls this for every series every frame).
+
+        Deliberately not a monotonic-deque running min/max: pushes
+        outnumber rendered frames by orders of magnitude here (10k+
+        samples/s against a 60 FPS scan), so shifting the cost to
+        per-push Python deque maintenance in the hottest path would be
+        a net loss against two SIMD passes over a float32 window.
+        """
+        # O(1) bail-out for empty/all-NaN windows via the incremental
+        # valid counter — no scan, and nanmin can no longer warn below
+        if self._valid_n == 0:
             return (np.nan, np.nan)
-        return (float(valid.min()), float(valid.max()))
+        data = self._window()
+        return (float(np.nanmin(data)), float(np.nanmax(data)))
 
     def clear(self) -> None:
         """Reset all data."""
@@ -120,3 +378,6 @@ class Series:
         self._count = 0
         self._running_sum = 0.0
         self._running_sq_sum = 0.0
+        self._sum_c = 0.0
+        self._sqsum_c = 0.0
+        self._valid_n = 0